@@ -15,8 +15,12 @@ Implementation of the RainFARM stochastic downscaling method as described in
 import warnings
 
 import numpy as np
+from scipy.fft import irfft2, next_fast_len, rfft2
 from scipy.ndimage import convolve
 
+# kernel size (number of elements) above which the convolutions are done via FFT
+_FFT_KERNEL_SIZE_THR = 81
+
 
 def _log_slope(log_k, log_power_spectrum):
     lk_min = log_k.min()
@@ -34,9 +38,47 @@ def _log_slope(log_k, log_power_spectrum):
     return alpha
 
 
-def _balanced_spatial_average(x, k):
-    ones = np.ones_like(x)
-    return convolve(x, k) / convolve(ones, k)
+def _convolve_reflect(fields, k):
+    # convolve each of the given fields of the same shape with k, which is
+    # equivalent to scipy.ndimage.convolve with the default 'reflect' boundary
+    # mode. For large kernels, the convolutions are computed in the Fourier
+    # domain, and the spectrum of the kernel is computed only once.
+    if k.size <= _FFT_KERNEL_SIZE_THR:
+        return [convolve(x, k) for x in fields]
+
+    pad = [(s - 1 - s // 2, s // 2) for s in k.shape]
+    shape = fields[0].shape
+    # wrap-around of the circular convolution only affects the first k.shape-1
+    # elements, which are discarded, if the transform is at least of the size
+    # of the padded field
+    fft_shape = [next_fast_len(shape[i] + k.shape[i] - 1, real=True) for i in range(2)]
+    k_f = rfft2(k, s=fft_shape)
+
+    fields_conv = []
+    for x in fields:
+        x_padded = np.pad(x, pad, mode="symmetric")
+        x_conv = irfft2(rfft2(x_padded, s=fft_shape) * k_f, s=fft_shape)
+        x_conv = x_conv[
+            k.shape[0] - 1 : k.shape[0] - 1 + shape[0],
+            k.shape[1] - 1 : k.shape[1] - 1 + shape[1],
+        ]
+
+        # set the round-off errors of the FFT to zero, so that zero-valued areas
+        # remain zero as with direct convolution
+        tol = 1e-12 * np.max(np.abs(x)) * np.sum(np.abs(k))
+        x_conv[np.abs(x_conv) < tol] = 0.0
+
+        fields_conv.append(x_conv)
+
+    return fields_conv
+
+
+def _balanced_spatial_average(fields, k):
+    # with the 'reflect' boundary mode, the convolution of a field of ones with
+    # k is equal to the sum of k everywhere, so the normalization does not
+    # require a second convolution
+    k_sum = np.sum(k)
+    return [x_conv / k_sum for x_conv in _convolve_reflect(fields, k)]
 
 
 def downscale(precip, alpha=None, ds_factor=16, threshold=None, return_alpha=False):
@@ -117,8 +159,7 @@ def downscale(precip, alpha=None, ds_factor=16, threshold=None, return_alpha=Fal
     tophat = ((mx ** 2 + my ** 2) <= rad ** 2).astype(float)
     tophat /= tophat.sum()
 
-    P_agg = _balanced_spatial_average(P_u, tophat)
-    r_agg = _balanced_spatial_average(r, tophat)
+    P_agg, r_agg = _balanced_spatial_average([P_u, r], tophat)
     r *= P_agg / r_agg
 
     if threshold is not None:
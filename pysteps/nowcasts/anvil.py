@@ -193,6 +193,11 @@ def forecast(
         # localized linear regression
         r_vil_a, r_vil_b = _r_vil_regression(vil[-1, :], rainrate, r_vil_window_radius)
 
+    # compute the coordinate grid once so that it is not recomputed in each call
+    # of the extrapolator
+    x_values, y_values = np.meshgrid(np.arange(n), np.arange(m))
+    extrap_kwargs["xy_coords"] = np.stack([x_values, y_values])
+
     # transform the input fields to Lagrangian coordinates by extrapolation
     extrapolator = extrapolation.get_method(extrap_method)
     res = list()
@@ -329,8 +334,17 @@ def forecast(
             starttime = time.time()
 
         # iterate the ARI models for each cascade level
-        for i in range(n_cascade_levels):
-            vil_dec[i, :] = autoregression.iterate_ar_model(vil_dec[i, :], phi[i])
+        if not DASK_IMPORTED or num_workers == 1:
+            for i in range(n_cascade_levels):
+                vil_dec[i, :] = autoregression.iterate_ar_model(vil_dec[i, :], phi[i])
+        else:
+            res = []
+            for i in range(n_cascade_levels):
+                res.append(dask.delayed(_iterate_ar_model_level)(vil_dec, phi, i))
+            num_workers_ = (
+                n_cascade_levels if num_workers > n_cascade_levels else num_workers
+            )
+            dask.compute(*res, num_workers=num_workers_)
 
         # recompose the cascade to obtain the forecast field
         vil_dec_dict = {}
@@ -459,6 +473,12 @@ def _estimate_ar2_params(gamma):
     return phi
 
 
+# Iterate the ARI model of the given cascade level in place. The cascade levels
+# are independent, which allows iterating them in parallel.
+def _iterate_ar_model_level(vil_dec, phi, i):
+    vil_dec[i, :] = autoregression.iterate_ar_model(vil_dec[i, :], phi[i])
+
+
 # Compute correlation coefficients of two 2d fields in a moving window with
 # a Gaussian weight function. See Section II.G of PCLH2020. Differently to the
 # standard formula for the Pearson correlation coefficient, the mean value of
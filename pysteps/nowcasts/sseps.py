@@ -465,15 +465,13 @@ def forecast(
         PHI = np.empty((n_windows_M, n_windows_N, n_cascade_levels, ar_order + 1))
         mu = np.empty((n_windows_M, n_windows_N, n_cascade_levels))
         sigma = np.empty((n_windows_M, n_windows_N, n_cascade_levels))
-        ff = []
-        rc = []
-        pp = []
-        mm = []
+        res = []
+        # the localization masks and their sum are the same for all ensemble
+        # members and time steps
+        mask_l = []
+        M_s = np.zeros((M, N), dtype=float)
         for m in range(n_windows_M):
-            ff_ = []
-            pp_ = []
-            rc_ = []
-            mm_ = []
+            mask_l_ = []
             for n in range(n_windows_N):
 
                 # compute indices of local window
@@ -486,8 +484,12 @@ def forecast(
                     np.min((idxn[0] + win_size[1] + overlap * win_size[1], N))
                 )
 
-                mask = np.zeros((M, N), dtype=bool)
-                mask[idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)] = True
+                # build localization mask
+                mask = _build_2D_tapering_function(
+                    (idxm.item(1) - idxm.item(0), idxn.item(1) - idxn.item(0))
+                )
+                mask_l_.append(mask)
+                M_s[idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)] += mask
 
                 R_ = R[:, idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)]
 
@@ -495,7 +497,39 @@ def forecast(
                 if war[m, n] > war_thr:
 
                     # estimate local parameters
-                    pars = estimator(R, parsglob, idxm, idxn)
+                    if not dask_imported or num_workers == 1:
+                        res.append(estimator(R, parsglob, idxm, idxn))
+                    else:
+                        res.append(
+                            dask.delayed(estimator)(
+                                R, parsglob, idxm.copy(), idxn.copy()
+                            )
+                        )
+
+            mask_l.append(mask_l_)
+        mask_l_ = None
+        mask = None
+        ind_s = M_s > 0
+        M_s = M_s[ind_s]
+
+        if dask_imported and num_workers > 1 and len(res) > 0:
+            num_workers_ = len(res) if num_workers > len(res) else num_workers
+            res = list(dask.compute(*res, num_workers=num_workers_))
+
+        ff = []
+        rc = []
+        pp = []
+        mm = []
+        k = 0
+        for m in range(n_windows_M):
+            ff_ = []
+            pp_ = []
+            rc_ = []
+            mm_ = []
+            for n in range(n_windows_N):
+                if war[m, n] > war_thr:
+                    pars = res[k]
+                    k += 1
                     ff_.append(pars["filter"])
                     pp_.append(pars["P"])
                     rc_.append(pars["R_c"])
@@ -522,6 +556,7 @@ def forecast(
         rc_ = None
         mm_ = None
         pars = None
+        res = None
 
     if measure_time:
         print("%.2f seconds." % (time.time() - starttime))
@@ -656,7 +691,6 @@ def forecast(
                 idxm = np.zeros((2, 1), dtype=int)
                 idxn = np.zeros((2, 1), dtype=int)
                 R_l = np.zeros((M, N), dtype=float)
-                M_s = np.zeros((M, N), dtype=float)
                 for m in range(n_windows_M):
                     for n in range(n_windows_N):
 
@@ -674,13 +708,6 @@ def forecast(
                             np.min((idxn[0] + win_size[1] + overlap * win_size[1], N))
                         )
 
-                        # build localization mask
-                        mask = _get_mask((M, N), idxm, idxn)
-                        mask_l = mask[
-                            idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)
-                        ]
-                        M_s += mask
-
                         # skip if dry
                         if war[m, n] > war_thr:
 
@@ -718,17 +745,10 @@ def forecast(
 
                             # compute the recomposed precipitation field(s) from the cascades
                             # obtained from the AR(p) model(s)
-                            mu_ = mu[m, n, :]
-                            sigma_ = sigma[m, n, :]
-                            R_c = [
-                                ((R_c[i, -1, :, :] * sigma_[i]) + mu_[i])
-                                * parsglob["sigma"][i]
-                                + parsglob["mu"][i]
-                                for i in range(len(mu_))
-                            ]
-                            R_l_ = np.sum(np.stack(R_c), axis=0)
+                            mu_ = mu[m, n, :] * parsglob["sigma"] + parsglob["mu"]
+                            sigma_ = sigma[m, n, :] * parsglob["sigma"]
+                            R_l_ = _recompose_cascade(R_c, mu_, sigma_)
                             R_c = mu_ = sigma_ = None
-                            # R_l_ = _recompose_cascade(R_c[:, :, :], mu[m, n, :], sigma[m, n, :])
                         else:
                             R_l_ = R_f_new[
                                 idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)
@@ -745,12 +765,11 @@ def forecast(
 
                         R_l[
                             idxm.item(0) : idxm.item(1), idxn.item(0) : idxn.item(1)
-                        ] += (R_l_ * mask_l)
+                        ] += (R_l_ * mask_l[m][n])
                         R_l_ = None
 
-                ind = M_s > 0
-                R_l[ind] *= 1 / M_s[ind]
-                R_l[~ind] = R_min
+                R_l[ind_s] *= 1 / M_s
+                R_l[~ind_s] = R_min
 
                 R_f_new = R_l.copy()
                 R_l = None
@@ -901,20 +920,23 @@ def _compute_incremental_mask(Rbin, kr, r):
     Rbin = np.ndarray.astype(Rbin.copy(), "uint8")
     Rd = scipy.ndimage.morphology.binary_dilation(Rbin, kr)
 
-    # add grayscale rim
-    kr1 = scipy.ndimage.generate_binary_structure(2, 1)
-    mask = Rd.astype(int)
-    for n in range(r):
-        Rd = scipy.ndimage.morphology.binary_dilation(Rd, kr1)
-        mask += Rd
+    # add grayscale rim: the n-th iterated dilation with the cross-shaped
+    # structuring element contains the pixels within the taxicab distance n
+    # from Rd, so the sum of the dilations is obtained by a distance transform
+    if np.any(Rd):
+        dist = scipy.ndimage.distance_transform_cdt(~Rd, metric="taxicab")
+        mask = np.maximum(r + 1 - dist, 0).astype(float)
+    else:
+        mask = Rd.astype(float)
     # normalize between 0 and 1
     return mask / mask.max()
 
 
 # TODO: Use the recomponse_cascade method in the cascade.decomposition module
 def _recompose_cascade(R, mu, sigma):
-    R_rc = [(R[i, -1, :, :] * sigma[i]) + mu[i] for i in range(len(mu))]
-    R_rc = np.sum(np.stack(R_rc), axis=0)
+    # sum the scaled cascade levels with a single contraction over the level
+    # axis instead of stacking the levels into a temporary array
+    R_rc = np.tensordot(sigma, R[:, -1, :, :], axes=1) + np.sum(mu)
 
     return R_rc
 
@@ -981,18 +1003,3 @@ def _build_2D_tapering_function(win_size, win_type="flat-hanning"):
     w2d[w2d < 1e-3] = 1e-3
 
     return w2d
-
-
-def _get_mask(Size, idxi, idxj, win_type="flat-hanning"):
-    """Compute a mask of zeros with a window at a given position."""
-
-    idxi = np.array(idxi).astype(int)
-    idxj = np.array(idxj).astype(int)
-
-    win_size = (idxi[1] - idxi[0], idxj[1] - idxj[0])
-    wind = _build_2D_tapering_function(win_size, win_type)
-
-    mask = np.zeros(Size)
-    mask[idxi.item(0) : idxi.item(1), idxj.item(0) : idxj.item(1)] = wind
-
-    return mask
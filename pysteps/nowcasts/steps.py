@@ -851,12 +851,14 @@ def _compute_incremental_mask(Rbin, kr, r):
     Rbin = np.ndarray.astype(Rbin.copy(), "uint8")
     Rd = scipy.ndimage.morphology.binary_dilation(Rbin, kr)
 
-    # add grayscale rim
-    kr1 = scipy.ndimage.generate_binary_structure(2, 1)
-    mask = Rd.astype(float)
-    for n in range(r):
-        Rd = scipy.ndimage.morphology.binary_dilation(Rd, kr1)
-        mask += Rd
+    # add grayscale rim: the n-th iterated dilation with the cross-shaped
+    # structuring element contains the pixels within the taxicab distance n
+    # from Rd, so the sum of the dilations is obtained by a distance transform
+    if np.any(Rd):
+        dist = scipy.ndimage.distance_transform_cdt(~Rd, metric="taxicab")
+        mask = np.maximum(r + 1 - dist, 0).astype(float)
+    else:
+        mask = Rd.astype(float)
     # normalize between 0 and 1
     return mask / mask.max()
 
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+from scipy.ndimage import convolve
+
+from pysteps.downscaling import rainfarm
+
+
+@pytest.mark.parametrize("kernel_size", [11, 19])
+def test_rainfarm_convolve_reflect(kernel_size):
+    """Test that the FFT convolution of rainfarm matches scipy.ndimage.convolve."""
+
+    randstate = np.random.RandomState(42)
+    field = randstate.uniform(0, 10, (128, 96))
+    field[:40, :] = 0
+    field[:, -30:] = 0
+    kernel = randstate.uniform(0, 1, (kernel_size, kernel_size))
+    assert kernel.size > rainfarm._FFT_KERNEL_SIZE_THR
+
+    field_conv = rainfarm._convolve_reflect([field], kernel)[0]
+    expected = convolve(field, kernel)
+
+    assert_array_almost_equal(field_conv, expected)
+    assert np.all(field_conv[expected == 0] == 0)
+    assert np.all(field_conv >= 0)
@@ -83,6 +83,36 @@ def test_estimate_ar_params_ols_localized():
             assert phi[i].shape == R.shape[1:]
 
 
+def test_estimate_ar_params_ols_localized_singular():
+    # the zero region is placed at the corner so that the moving window sums
+    # are exactly zero there
+    x = np.random.RandomState(42).uniform(1, 2, (3, 50, 40))
+    x[:, :20, :20] = 0.0
+    p = 2
+    window_radius = 2
+
+    phi = autoregression.estimate_ar_params_ols_localized(
+        x, p, window_radius, window="uniform"
+    )
+
+    # the normal equations are singular where the window only covers zeros
+    singular = np.zeros(x.shape[1:], dtype=bool)
+    singular[: 20 - window_radius, : 20 - window_radius] = True
+    for i in range(p):
+        assert np.all(np.isnan(phi[i]) == singular)
+
+    for i, j in zip(*np.nonzero(~singular)):
+        x_w = x[
+            :,
+            max(i - window_radius, 0) : i + window_radius + 1,
+            max(j - window_radius, 0) : j + window_radius + 1,
+        ].reshape(3, -1)
+        Z = x_w[p - 1 :: -1, :]
+        b = np.linalg.solve(np.dot(Z, Z.T), np.dot(Z, x_w[p, :]))
+        for k in range(p):
+            assert np.isclose(phi[k][i, j], b[k])
+
+
 def test_estimate_var_params_ols():
     R = _create_data_multivariate()
     q = R.shape[1]
@@ -179,6 +209,15 @@ def test_iterate_ar_localized():
     assert R_.shape == R.shape
 
 
+def test_iterate_ar_univariate():
+    x = np.array([1.0, 2.0, 3.0])
+    phi = [0.5, 0.2, 0.1]
+
+    x_ = autoregression.iterate_ar_model(x, phi, eps=np.array([1.0]))
+    assert x_.shape == x.shape
+    assert np.allclose(x_, [2.0, 3.0, 0.5 * 3.0 + 0.2 * 2.0 + 0.1])
+
+
 def test_iterate_var():
     R = _create_data_multivariate()
     p = 2
@@ -11,6 +11,7 @@ from pysteps.utils import (
     arrays,
     conversion,
     dimension,
+    interpolate,
     transformation,
     aggregate_fields,
 )
@@ -830,3 +831,70 @@ def test_sqrt_transform(R, metadata, inverse, expected):
     assert_array_almost_equal(
         transformation.sqrt_transform(R, metadata, inverse)[0], expected
     )
+
+
+# ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# interpolate
+
+# rbfinterp2d
+coord = np.random.RandomState(42).uniform(0, 10, (20, 2))
+values = np.random.RandomState(24).uniform(0, 1, (20, 2))
+xgrid = np.linspace(0, 10, 9)
+ygrid = np.linspace(0, 10, 7)
+
+
+def _rbfinterp2d_reference(rbfunction, epsilon, k):
+    # direct computation of the interpolation weights for each grid point
+    qcoord = np.percentile(coord, [2, 98], axis=0)
+    dextent = np.max(np.diff(qcoord, axis=0))
+    X, Y = np.meshgrid(xgrid, ygrid)
+    grid = np.column_stack((X.ravel(), Y.ravel()))
+    d = np.linalg.norm((grid[:, None, :] - coord[None, :, :]) / dextent, axis=2)
+    inds = np.argsort(d, axis=1)
+    if k is not None:
+        inds = inds[:, :k]
+    d = np.take_along_axis(d, inds, axis=1)
+
+    if rbfunction == "nearest":
+        output = values[inds[:, 0], :]
+    else:
+        if rbfunction == "gaussian":
+            w = np.exp(-((d * epsilon) ** 2))
+        elif rbfunction == "inverse quadratic":
+            w = 1.0 / (1 + (epsilon * d) ** 2)
+        elif rbfunction == "inverse multiquadric":
+            w = 1.0 / np.sqrt(1 + (epsilon * d) ** 2)
+        elif rbfunction == "bump":
+            w = np.exp(-1.0 / (1 - (epsilon * d) ** 2))
+            w[d >= 1 / epsilon] = 0.0
+        w[np.sum(w, axis=1) == 0, :] = 1.0
+        output = np.sum(w[:, :, None] * values[inds, :], axis=1)
+        output /= np.sum(w, axis=1)[:, None]
+
+    return np.moveaxis(output.reshape(ygrid.size, xgrid.size, 2), -1, 0)
+
+
+test_data = [
+    (rbfunction, k)
+    for rbfunction in [
+        "nearest",
+        "gaussian",
+        "inverse quadratic",
+        "inverse multiquadric",
+        "bump",
+    ]
+    for k in [None, 1, 5]
+]
+
+
+@pytest.mark.parametrize("rbfunction, k", test_data)
+def test_rbfinterp2d(rbfunction, k):
+    """Test the rbfinterp2d."""
+    output = interpolate.rbfinterp2d(
+        coord, values, xgrid, ygrid, rbfunction=rbfunction, epsilon=5, k=k
+    )
+    if k == 1:
+        # k=1 always gives the nearest neighbour
+        rbfunction = "nearest"
+    expected = _rbfinterp2d_reference(rbfunction, 5, k)
+    assert_array_almost_equal(output, expected)
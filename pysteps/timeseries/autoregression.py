@@ -310,68 +310,53 @@ def estimate_ar_params_ols_localized(
     else:
         window_size = window_radius
 
+    # the moving window sums are linear, so the products are accumulated over
+    # the history before filtering, and the symmetry of Z2 is exploited
     XZ = np.zeros(np.hstack([[p], x.shape[1:]]))
     for i in range(p):
+        tmp = 0.0
         for j in range(h + 1):
-            tmp = convol_filter(
-                x[p + j, :] * x[p - 1 - i + j, :], window_size, mode="constant"
-            )
-            XZ[i, :] += tmp
+            tmp = tmp + x[p + j, :] * x[p - 1 - i + j, :]
+        XZ[i, :] = convol_filter(tmp, window_size, mode="constant")
 
     if include_constant_term:
-        v = 0.0
-        for i in range(h + 1):
-            v += convol_filter(x[p + i, :], window_size, mode="constant")
+        v = convol_filter(np.sum(x[p:, :], axis=0), window_size, mode="constant")
         XZ = np.vstack([v[np.newaxis, :], XZ])
 
     if not include_constant_term:
         Z2 = np.zeros(np.hstack([[p, p], x.shape[1:]]))
-        for i in range(p):
-            for j in range(p):
-                for k in range(h + 1):
-                    tmp = convol_filter(
-                        x[p - 1 - i + k, :] * x[p - 1 - j + k, :],
-                        window_size,
-                        mode="constant",
-                    )
-                    Z2[i, j, :] += tmp
+        k0 = 0
     else:
         Z2 = np.zeros(np.hstack([[p + 1, p + 1], x.shape[1:]]))
         Z2[0, 0, :] = convol_filter(np.ones(x.shape[1:]), window_size, mode="constant")
         for i in range(p):
-            for j in range(h + 1):
-                tmp = convol_filter(x[p - 1 - i + j, :], window_size, mode="constant")
-                Z2[0, i + 1, :] += tmp
-                Z2[i + 1, 0, :] += tmp
-        for i in range(p):
-            for j in range(p):
-                for k in range(h + 1):
-                    tmp = convol_filter(
-                        x[p - 1 - i + k, :] * x[p - 1 - j + k, :],
-                        window_size,
-                        mode="constant",
-                    )
-                    Z2[i + 1, j + 1, :] += tmp
+            tmp = convol_filter(
+                np.sum(x[p - 1 - i : p - i + h, :], axis=0),
+                window_size,
+                mode="constant",
+            )
+            Z2[0, i + 1, :] = tmp
+            Z2[i + 1, 0, :] = tmp
+        k0 = 1
+    for i in range(p):
+        for j in range(i, p):
+            tmp = 0.0
+            for k in range(h + 1):
+                tmp = tmp + x[p - 1 - i + k, :] * x[p - 1 - j + k, :]
+            tmp = convol_filter(tmp, window_size, mode="constant")
+            Z2[i + k0, j + k0, :] = tmp
+            Z2[j + k0, i + k0, :] = tmp
 
     m = np.prod(x.shape[1:])
-    phi = np.empty(np.hstack([[p], m]))
-    if include_constant_term:
-        c = np.empty(m)
-    XZ = XZ.reshape(np.hstack([[XZ.shape[0]], m]))
+    XZ = XZ.reshape(np.hstack([[XZ.shape[0], 1], m]))
     Z2 = Z2.reshape(np.hstack([[Z2.shape[0], Z2.shape[1]], m]))
 
-    for i in range(m):
-        try:
-            b = np.dot(XZ[:, i], np.linalg.inv(Z2[:, :, i] + lam * np.eye(Z2.shape[0])))
-            if not include_constant_term:
-                phi[:, i] = b
-            else:
-                phi[:, i] = b[1:]
-                c[i] = b[0]
-        except np.linalg.LinAlgError:
-            phi[:, i] = np.nan
-            if include_constant_term:
-                c[i] = np.nan
+    b = _solve_localized_normal_equations(Z2, XZ, lam)[:, :, 0].T
+    if not include_constant_term:
+        phi = b
+    else:
+        phi = b[1:, :]
+        c = b[0, :]
 
     if p == 1:
         phi_pert = np.sqrt(1.0 - phi[0, :] * phi[0, :])
@@ -748,84 +733,68 @@ def estimate_var_params_ols_localized(
     else:
         window_size = window_radius
 
+    # the moving window sums are linear, so the products are accumulated over
+    # the history before filtering, and the symmetry of Z2 is exploited
     XZ = np.zeros(np.hstack([[q, p * q], x.shape[2:]]))
     for i in range(q):
         for k in range(p):
             for j in range(q):
+                tmp = 0.0
                 for l in range(h + 1):
-                    tmp = convol_filter(
-                        x[p + l, i, :] * x[p - 1 - k + l, j, :],
-                        window_size,
-                        mode="constant",
-                    )
-                    XZ[i, k * q + j, :] += tmp
+                    tmp = tmp + x[p + l, i, :] * x[p - 1 - k + l, j, :]
+                XZ[i, k * q + j, :] = convol_filter(tmp, window_size, mode="constant")
 
     if include_constant_term:
-        v = np.zeros(np.hstack([[q], x.shape[2:]]))
+        v = np.empty(np.hstack([[q], x.shape[2:]]))
         for i in range(q):
-            for j in range(h + 1):
-                v[i, :] += convol_filter(x[p + j, i, :], window_size, mode="constant")
+            v[i, :] = convol_filter(
+                np.sum(x[p:, i, :], axis=0), window_size, mode="constant"
+            )
         XZ = np.hstack([v[:, np.newaxis, :], XZ])
 
     if not include_constant_term:
         Z2 = np.zeros(np.hstack([[p * q, p * q], x.shape[2:]]))
-        for i in range(p):
-            for j in range(q):
-                for k in range(p):
-                    for l in range(q):
-                        for m in range(h + 1):
-                            tmp = convol_filter(
-                                x[p - 1 - i + m, j, :] * x[p - 1 - k + m, l, :],
-                                window_size,
-                                mode="constant",
-                            )
-                            Z2[i * q + j, k * q + l, :] += tmp
+        k0 = 0
     else:
         Z2 = np.zeros(np.hstack([[p * q + 1, p * q + 1], x.shape[2:]]))
         Z2[0, 0, :] = convol_filter(np.ones(x.shape[2:]), window_size, mode="constant")
         for i in range(p):
             for j in range(q):
-                for k in range(h + 1):
-                    tmp = convol_filter(
-                        x[p - 1 - i + k, j, :], window_size, mode="constant"
-                    )
-                    Z2[0, i * q + j + 1, :] += tmp
-                    Z2[i * q + j + 1, 0, :] += tmp
-        for i in range(p):
-            for j in range(q):
-                for k in range(p):
-                    for l in range(q):
-                        for m in range(h + 1):
-                            tmp = convol_filter(
-                                x[p - 1 - i + m, j, :] * x[p - 1 - k + m, l, :],
-                                window_size,
-                                mode="constant",
-                            )
-                            Z2[i * q + j + 1, k * q + l + 1, :] += tmp
+                tmp = convol_filter(
+                    np.sum(x[p - 1 - i : p - i + h, j, :], axis=0),
+                    window_size,
+                    mode="constant",
+                )
+                Z2[0, i * q + j + 1, :] = tmp
+                Z2[i * q + j + 1, 0, :] = tmp
+        k0 = 1
+    for a in range(p * q):
+        i, j = divmod(a, q)
+        for b in range(a, p * q):
+            k, l = divmod(b, q)
+            tmp = 0.0
+            for m in range(h + 1):
+                tmp = tmp + x[p - 1 - i + m, j, :] * x[p - 1 - k + m, l, :]
+            tmp = convol_filter(tmp, window_size, mode="constant")
+            Z2[a + k0, b + k0, :] = tmp
+            Z2[b + k0, a + k0, :] = tmp
 
     m = np.prod(x.shape[2:])
-    if include_constant_term:
-        c = np.empty((m, q))
     XZ = XZ.reshape((XZ.shape[0], XZ.shape[1], m))
     Z2 = Z2.reshape((Z2.shape[0], Z2.shape[1], m))
 
+    # the solution has shape (m, p*q(+1), q), and its transpose for each sample
+    # contains the parameter matrices side by side
+    B = _solve_localized_normal_equations(Z2, np.swapaxes(XZ, 0, 1), lam)
+    B = np.swapaxes(B, 1, 2)
     phi = np.empty((p, m, q, q))
-    for i in range(m):
-        try:
-            B = np.dot(
-                XZ[:, :, i], np.linalg.inv(Z2[:, :, i] + lam * np.eye(Z2.shape[0]))
-            )
-            for k in range(p):
-                if not include_constant_term:
-                    phi[k, i, :, :] = B[:, k * q : (k + 1) * q]
-                else:
-                    phi[k, i, :, :] = B[:, k * q + 1 : (k + 1) * q + 1]
-            if include_constant_term:
-                c[i, :] = B[:, 0]
-        except np.linalg.LinAlgError:
-            phi[:, i, :, :] = np.nan
-            if include_constant_term:
-                c[i, :] = np.nan
+    for k in range(p):
+        if not include_constant_term:
+            phi[k, :, :, :] = B[:, :, k * q : (k + 1) * q]
+        else:
+            phi[k, :, :, :] = B[:, :, k * q + 1 : (k + 1) * q + 1]
+    if include_constant_term:
+        c = B[:, :, 0]
 
     phi_out = [
         phi[i].reshape(np.hstack([x.shape[2:], [q, q]])) for i in range(len(phi))
@@ -1044,20 +1013,32 @@ def iterate_ar_model(x, phi, eps=None):
             % (str(x.shape), str(eps.shape[1:]))
         )
 
-    x_new = 0.0
-
     p = len(phi) - 1
 
-    for i in range(p):
+    # the new values are written directly into the last element of the output
+    # array, which avoids the temporary arrays of the sum and concatenation
+    if eps is not None:
+        dtype = np.result_type(x, 0.0, eps, *phi)
+    else:
+        dtype = np.result_type(x, 0.0, *phi[:p])
+    x_out = np.empty(x.shape, dtype=dtype)
+    x_out[:-1] = x[1:]
+    x_new = x_out[-1]
+
+    if p > 0:
+        np.multiply(phi[0], x[-1, :], out=x_new)
+    else:
+        x_new[:] = 0.0
+    for i in range(1, p):
         x_new += phi[i] * x[-(i + 1), :]
 
     if eps is not None:
         x_new += phi[-1] * eps
 
     if x_simple_shape:
-        return np.hstack([x[1:], [x_new]])
+        return x_out[:, 0]
     else:
-        return np.concatenate([x[1:, :], x_new[np.newaxis, :]])
+        return x_out
 
 
 def iterate_var_model(x, phi, eps=None):
@@ -1181,6 +1162,29 @@ def test_var_stationarity(phi):
     return False if np.any(np.abs(r) >= 1) else True
 
 
+def _solve_localized_normal_equations(Z2, XZ, lam):
+    # Solve the normal equations (Z2_i + lam*I) b_i = XZ_i of the localized OLS
+    # estimators for all samples i at once. Z2 has shape (k, k, m) and is
+    # symmetric for each sample, XZ has shape (k, l, m) and the solution has
+    # shape (m, k, l). The solutions of singular systems are set to nan.
+    A = np.moveaxis(Z2, -1, 0) + lam * np.eye(Z2.shape[0])
+    rhs = np.moveaxis(XZ, -1, 0)
+
+    try:
+        return np.linalg.solve(A, rhs)
+    except np.linalg.LinAlgError:
+        # fall back to solving the systems one by one to isolate the singular
+        # ones
+        b = np.empty(rhs.shape)
+        for i in range(A.shape[0]):
+            try:
+                b[i] = np.linalg.solve(A[i], rhs[i])
+            except np.linalg.LinAlgError:
+                b[i] = np.nan
+
+        return b
+
+
 def _compute_differenced_model_params(phi, p, q, d):
     phi_out = []
     for i in range(p + d):
@@ -56,6 +56,7 @@ def rbfinterp2d(
         The number of nearest neighbours used for each target location.
         This can also be useful to to speed-up the interpolation.
         If set to None, it interpolates using all the data points at once.
+        It is ignored when ``rbfunction`` is "nearest".
     nchunks: int, optional
         The number of chunks in which the grid points are split to limit the
         memory usage during the interpolation.
@@ -149,6 +150,10 @@ def rbfinterp2d(
             + str(_rbfunctions)
         ) from None
 
+    # nearest neighbour interpolation only uses the closest data point
+    if rbfunction == "nearest":
+        k = 1
+
     # generate the target grid
     X, Y = np.meshgrid(xgrid, ygrid)
     grid = np.column_stack((X.ravel(), Y.ravel()))
@@ -173,6 +178,11 @@ def rbfinterp2d(
     else:
         subgrids = [grid]
 
+    # contiguous copy of the input values of each variable for the
+    # neighbour lookups
+    if k > 1:
+        input_array_t = np.ascontiguousarray(input_array.T)
+
     # loop subgrids
     i0 = 0
     output_array = np.zeros((grid.shape[0], nvar))
@@ -182,9 +192,6 @@ def rbfinterp2d(
         if k == 0:
             # use all points
             d = scipy.spatial.distance.cdist(coord, subgrid, "euclidean").transpose()
-            inds = np.arange(npoints)[None, :] * np.ones(
-                (subgrid.shape[0], npoints)
-            ).astype(int)
 
         else:
             # use k-nearest neighbours
@@ -196,28 +203,45 @@ def rbfinterp2d(
 
         else:
 
-            # the interpolation weights
+            # the interpolation weights, computed in place to avoid temporary
+            # arrays of the size of d
+            w = d * epsilon
+            w *= w
             if rbfunction == "gaussian":
-                w = np.exp(-((d * epsilon) ** 2))
+                np.negative(w, out=w)
+                np.exp(w, out=w)
 
             elif rbfunction == "inverse quadratic":
-                w = 1.0 / (1 + (epsilon * d) ** 2)
+                w += 1.0
+                np.reciprocal(w, out=w)
 
             elif rbfunction == "inverse multiquadric":
-                w = 1.0 / np.sqrt(1 + (epsilon * d) ** 2)
+                w += 1.0
+                np.sqrt(w, out=w)
+                np.reciprocal(w, out=w)
 
             elif rbfunction == "bump":
-                w = np.exp(-1.0 / (1 - (epsilon * d) ** 2))
-                w[d >= 1 / epsilon] = 0.0
-
-            if not np.all(np.sum(w, axis=1)):
-                w[np.sum(w, axis=1) == 0, :] = 1.0
-
-            # interpolate
-            for j in range(nvar):
-                output_array[i0 : (i0 + idelta), j] = np.sum(
-                    w * input_array[inds, j], axis=1
-                ) / np.sum(w, axis=1)
+                bump_mask = d >= 1 / epsilon
+                np.subtract(1.0, w, out=w)
+                np.divide(-1.0, w, out=w)
+                np.exp(w, out=w)
+                w[bump_mask] = 0.0
+
+            # normalize the weights once for all variables
+            w_sum = np.sum(w, axis=1)
+            if not np.all(w_sum):
+                w[w_sum == 0, :] = 1.0
+                w_sum[w_sum == 0] = w.shape[1]
+            w /= w_sum[:, None]
+
+            # interpolate with a fused multiply-reduce
+            if k == 0:
+                output_array[i0 : (i0 + idelta), :] = np.dot(w, input_array)
+            else:
+                for j in range(nvar):
+                    output_array[i0 : (i0 + idelta), j] = np.einsum(
+                        "ij,ij->i", w, input_array_t[j][inds]
+                    )
 
         i0 += idelta
 